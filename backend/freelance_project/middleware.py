@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+def parse_accept_encoding(header):
+    """
+    Return (accepted, refused) sets of codings from an Accept-Encoding
+    header. Codings sent with `;q=0` are refused, which overrides `*`.
+    """
+    accepted, refused = set(), set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        (accepted if q > 0 else refused).add(coding)
+    return accepted, refused
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Content-negotiated response compression.
+
+    Prefers brotli (an optional dependency) when it is installed,
+    enabled and the client accepts it, otherwise gzip. Responses smaller than
+    RESPONSE_COMPRESSION_MIN_SIZE bytes, streaming responses (e.g. WhiteNoise
+    static files, which ship pre-compressed) and responses that already carry
+    a Content-Encoding are left untouched.
+
+    BREACH: gzip output gets the same random-length padding as
+    django.middleware.gzip.GZipMiddleware. Brotli has no header field to pad,
+    so brotli responses have NO BREACH mitigation beyond Django's per-request
+    CSRF token masking. Set RESPONSE_COMPRESSION_BROTLI = False to serve
+    gzip only.
+    """
+    # Random gzip filename padding, as in GZipMiddleware (gzip only).
+    max_random_bytes = 100
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, 'RESPONSE_COMPRESSION_MIN_SIZE', 500)
+        self.brotli_enabled = getattr(settings, 'RESPONSE_COMPRESSION_BROTLI', True)
+        self.brotli_quality = getattr(settings, 'RESPONSE_COMPRESSION_BROTLI_QUALITY', 5)
+
+    def select_encoding(self, request):
+        accepted, refused = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+
+        def acceptable(coding):
+            return coding not in refused and (coding in accepted or '*' in accepted)
+
+        if self.brotli_enabled and brotli is not None and acceptable('br'):
+            return 'br'
+        if acceptable('gzip'):
+            return 'gzip'
+        return None
+
+    def compress(self, content, encoding):
+        if encoding == 'br':
+            return brotli.compress(content, quality=self.brotli_quality)
+        return compress_string(content, max_random_bytes=self.max_random_bytes)
+
+    def process_response(self, request, response):
+        if response.streaming or len(response.content) < self.min_size:
+            return response
+
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self.select_encoding(request)
+        if encoding is None:
+            return response
+
+        compressed_content = self.compress(response.content, encoding)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers['Content-Length'] = str(len(response.content))
+
+        # A compressed representation can't share a strong ETag with the
+        # identity one (RFC 9110 Section 8.8.1).
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+
+        return response
@@ -0,0 +1,89 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def contains_non_finite_float(data):
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+            continue
+        if isinstance(value, dict):
+            value = value.values()
+        elif not isinstance(value, (list, tuple)):
+            continue
+        for item in value:
+            # Serializer output is overwhelmingly scalars; skip them cheaply.
+            kind = type(item)
+            if kind is str or kind is int or kind is bool or item is None:
+                continue
+            if kind is float:
+                if not math.isfinite(item):
+                    return True
+                continue
+            stack.append(item)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+
+    Datetimes, dates, times and Decimals are passed through to DRF's own
+    JSONEncoder.default, so their formatting is unchanged. The one visible
+    difference is float formatting: orjson writes exponents without padding
+    (`1e-7` where the stdlib writes `1e-07`). The serializers in this project
+    emit Decimals as strings and no floats, so their output is identical.
+
+    Indented output (browsable API, `; indent=N` media types), anything orjson
+    cannot encode and NaN/Infinity (which orjson turns into null, where
+    STRICT_JSON makes JSONRenderer raise) fall back to the stdlib
+    implementation, as does a missing orjson (it is an optional dependency).
+    """
+
+    def __init__(self):
+        self._default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self._default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError (e.g. integers
+            # wider than 64 bits); let the stdlib encoder handle them.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson writes non-finite floats as null; those are the only source
+        # of a null that needs a second look.
+        if b'null' in ret and contains_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep the output a strict javascript subset, as JSONRenderer does.
+        return ret.replace(
+            '\u2028'.encode(), b'\\u2028'
+        ).replace(
+            '\u2029'.encode(), b'\\u2029'
+        )
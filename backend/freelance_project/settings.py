@@ -36,6 +36,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    # Compress responses (gzip/brotli) after every other middleware is done with them
+    'freelance_project.middleware.CompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -79,6 +81,9 @@ if os.environ.get('RENDER'):
             'PASSWORD': os.environ['DB_PASSWORD'],
             'HOST':     os.environ['DB_HOST'],
             'PORT':     os.environ.get('DB_PORT', '5432'),
+            # Keep connections open between requests so warmup isn't wasted
+            'CONN_MAX_AGE':       config('DB_CONN_MAX_AGE', default=60, cast=int),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 else:
@@ -124,8 +129,19 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed renderer; same output as DRF's JSONRenderer apart from float exponents
+    'DEFAULT_RENDERER_CLASSES': [
+        'freelance_project.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+# Response compression: bodies smaller than this (in bytes) are sent as-is
+RESPONSE_COMPRESSION_MIN_SIZE = config('RESPONSE_COMPRESSION_MIN_SIZE', default=500, cast=int)
+# Brotli output carries no BREACH padding (gzip does); set False to serve gzip only
+RESPONSE_COMPRESSION_BROTLI = config('RESPONSE_COMPRESSION_BROTLI', default=True, cast=bool)
+RESPONSE_COMPRESSION_BROTLI_QUALITY = config('RESPONSE_COMPRESSION_BROTLI_QUALITY', default=5, cast=int)
+
 # CORS & CSRF configuration
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -0,0 +1,114 @@
+import datetime
+import gzip
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from users.models import User
+
+from .middleware import CompressionMiddleware, parse_accept_encoding
+from .renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def assertSameOutput(self, data, media_type='application/json'):
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_matches_drf_for_serializer_types(self):
+        self.assertSameOutput({
+            'id': 1,
+            'title': 'Build site é',
+            'budget': Decimal('123.45'),
+            'created_at': datetime.datetime(2025, 7, 25, 18, 19, 1, 123456, tzinfo=datetime.timezone.utc),
+            'deadline': None,
+            'day': datetime.date(2025, 7, 25),
+            'time': datetime.time(9, 30),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'nested': [{'is_active': True}, {'score': 1.5}],
+            'line_separators': '\u2028\u2029',
+            2: 'non-string key',
+        })
+
+    def test_indented_output_matches_drf(self):
+        self.assertSameOutput({'a': [1, 2]}, 'application/json; indent=4')
+
+    def test_large_integers_fall_back(self):
+        self.assertSameOutput({'big': 2 ** 70})
+
+    def test_non_finite_floats_raise_like_drf(self):
+        for value in (float('nan'), float('inf'), float('-inf')):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render({'nested': [value]})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+@override_settings(RESPONSE_COMPRESSION_MIN_SIZE=100, RESPONSE_COMPRESSION_BROTLI=True)
+class CompressionMiddlewareTests(SimpleTestCase):
+    body = b'{"jobs": [' + b'{"title": "Build site"},' * 50 + b'{}]}'
+
+    def get_response(self, accept_encoding, body=None):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        middleware = CompressionMiddleware(lambda request: HttpResponse(body or self.body))
+        return middleware(request)
+
+    def test_parse_accept_encoding_keeps_refusals(self):
+        self.assertEqual(
+            parse_accept_encoding('gzip;q=0.5, br;q=0, *'),
+            ({'gzip', '*'}, {'br'}),
+        )
+
+    def test_prefers_brotli(self):
+        self.assertEqual(self.get_response('gzip, br')['Content-Encoding'], 'br')
+
+    def test_refused_coding_overrides_wildcard(self):
+        self.assertEqual(self.get_response('*, br;q=0')['Content-Encoding'], 'gzip')
+
+    def test_all_refused(self):
+        response = self.get_response('*;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.body)
+
+    def test_gzip_round_trip(self):
+        response = self.get_response('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    @override_settings(RESPONSE_COMPRESSION_BROTLI=False)
+    def test_brotli_can_be_disabled(self):
+        self.assertEqual(self.get_response('br, gzip')['Content-Encoding'], 'gzip')
+
+    def test_small_responses_untouched(self):
+        response = self.get_response('gzip, br', body=b'{}')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+class HealthViewTests(TestCase):
+    def test_anonymous_gets_status_only(self):
+        response = self.client.get('/api/health/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
+
+    def test_staff_see_timings(self):
+        staff = User.objects.create_user('staff', password='pw', user_type='client', is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get('/api/health/')
+        self.assertEqual(response.json()['status'], 'ok')
+        self.assertIn('database', response.json()['timings_ms'])
+
+    def test_backend_failure_is_503(self):
+        with mock.patch('django.core.cache.backends.locmem.LocMemCache.get', side_effect=ConnectionError):
+            with self.assertLogs('freelance_project.views', 'ERROR'):
+                response = self.client.get('/api/health/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {'status': 'unavailable'})
@@ -5,15 +5,17 @@ from django.conf.urls.static import static
 from django.http import JsonResponse
 from django.middleware.csrf import get_token
 
+from .views import health
+
 
 def csrf(request):
     return JsonResponse({'message': 'CSRF cookie set', 'csrfToken': get_token(request)})
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/health/', health, name='health'),
     path('api/auth/csrf/', csrf, name='csrf'),
     path('api/auth/', include('users.urls')),
     path('api/jobs/', include('jobs.urls')),
-    path('api/auth/', include('users.urls')),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,31 @@
+import logging
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .warmup import warmup
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def health(request):
+    """
+    Health check that also warms the process (DB connection, URL resolver,
+    serializers) on its first call. Point the platform's health check path
+    here. Per-step timings are only shown to staff.
+    """
+    try:
+        timings = warmup()
+    except Exception:
+        # Any backend failure (database, cache, ...) means we can't serve.
+        logger.exception('Health check failed')
+        return Response({'status': 'unavailable'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    data = {'status': 'ok'}
+    if request.user.is_staff:
+        data['timings_ms'] = timings
+    return Response(data)
@@ -0,0 +1,75 @@
+import time
+
+from django.core.cache import caches
+from django.db import connections
+from django.urls import get_resolver
+
+
+def _timed(timings, name, func):
+    start = time.perf_counter()
+    func()
+    timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def _prime_database():
+    for connection in connections.all():
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def _prime_caches():
+    for cache in caches.all():
+        cache.get('warmup')
+
+
+def _prime_urls():
+    # Builds the resolver and imports every view module along the way.
+    get_resolver().url_patterns
+
+
+def _prime_serializers():
+    from jobs.serializers import CreateJobApplicationSerializer, JobApplicationSerializer, JobSerializer
+    from users.serializers import LoginSerializer, UserSerializer
+
+    for serializer_class in (
+        JobSerializer, JobApplicationSerializer, CreateJobApplicationSerializer,
+        UserSerializer, LoginSerializer,
+    ):
+        serializer_class().fields
+
+
+def _prime_renderers():
+    from freelance_project.renderers import FastJSONRenderer
+
+    FastJSONRenderer().render({'warmup': True})
+
+
+_primed = False
+
+
+def check():
+    """
+    Cheap per-call checks: a round trip to every database and cache backend.
+    Raises whatever the failing backend raises; returns timings in ms.
+    """
+    timings = {}
+    _timed(timings, 'database', _prime_database)
+    _timed(timings, 'caches', _prime_caches)
+    return timings
+
+
+def warmup():
+    """
+    Pay the first-request costs up front: open database connections, build
+    cache backends, the URL resolver and serializer field maps, and load the
+    JSON renderer. The one-time steps run once per process; later calls only
+    repeat check(). Returns per-step timings in ms.
+    """
+    global _primed
+    timings = check()
+    if not _primed:
+        _timed(timings, 'urls', _prime_urls)
+        _timed(timings, 'serializers', _prime_serializers)
+        _timed(timings, 'renderers', _prime_renderers)
+        _primed = True
+    return timings
@@ -7,10 +7,22 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
 
+import logging
 import os
 
+from decouple import config
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'freelance_project.settings')
 
 application = get_wsgi_application()
+
+# Prime each worker before it accepts traffic so the first request after a
+# cold start doesn't pay for URL resolution, imports and the DB handshake.
+if config('WARMUP_ON_START', default=bool(os.environ.get('RENDER')), cast=bool):
+    from freelance_project.warmup import warmup
+
+    try:
+        warmup()
+    except Exception:
+        logging.getLogger(__name__).exception('Warmup failed; continuing cold')
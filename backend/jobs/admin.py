@@ -1,15 +1,147 @@
-from django.contrib import admin
+import json
+
+from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from users.models import User
+from . import stats
 from .models import Job, JobApplication
 
+# Largest value a BigAutoField primary key can hold.
+MAX_PK = 2 ** 63 - 1
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the PostgreSQL planner instead of running COUNT(*).
+
+    Unfiltered changelists read the row estimate from pg_class; filtered ones
+    ask EXPLAIN for the planner's estimate. Small results (and every other
+    database backend) still get an exact count, so short lists stay precise.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+    def estimated_count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor != 'postgresql':
+            return None
+        if not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 for tables that have never been analyzed
+            return row[0] if row and row[0] >= 0 else None
+        plan = json.loads(queryset.order_by().explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class PerformanceModelAdmin(admin.ModelAdmin):
+    """
+    Base admin for the large marketplace tables.
+
+    Uses estimated paginator counts, skips the extra unfiltered COUNT(*) and
+    applies bulk actions in fixed-size chunks so no single UPDATE holds locks
+    across the whole table. Rows are ordered by primary key, which is always
+    indexed.
+    """
+    paginator = EstimatedCountPaginator
+    ordering = ('-pk',)
+    show_full_result_count = False
+    bulk_action_chunk_size = 1000
+
+    def update_in_chunks(self, queryset, before_update=None, **values):
+        # update() skips model signals, so callers pass `before_update` to
+        # keep derived data (e.g. the stats rollup) in step, chunk by chunk.
+        pks = list(queryset.order_by().values_list('pk', flat=True))
+        updated = 0
+        for start in range(0, len(pks), self.bulk_action_chunk_size):
+            chunk = queryset.filter(pk__in=pks[start:start + self.bulk_action_chunk_size])
+            with transaction.atomic():
+                # Lock the rows that still match before touching the rollup,
+                # so a concurrent edit can't slip between the two and leave
+                # the stats counting rows this UPDATE never changed.
+                locked = list(chunk.select_related(None).select_for_update().values_list('pk', flat=True))
+                if not locked:
+                    continue
+                chunk = queryset.model._default_manager.filter(pk__in=locked)
+                if before_update is not None:
+                    before_update(chunk)
+                updated += chunk.update(**values)
+        return updated
+
+
 @admin.register(Job)
-class JobAdmin(admin.ModelAdmin):
+class JobAdmin(PerformanceModelAdmin):
     list_display = ('title', 'client', 'category', 'budget', 'is_active', 'created_at')
     list_filter = ('category', 'is_active', 'created_at')
-    search_fields = ('title', 'description')
-    date_hierarchy = 'created_at'
+    list_select_related = ('client',)
+    autocomplete_fields = ('client',)
+    search_fields = ('^title',)
+    search_help_text = 'Search by job ID or the start of the title.'
+    actions = ('deactivate_jobs',)
+
+    def get_search_results(self, request, queryset, search_term):
+        # Prefix lookups served by the UPPER(title) pattern index instead of
+        # '%term%' scans over title and description.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        matches = Q(title__istartswith=search_term)
+        if search_term.isdecimal() and int(search_term) <= MAX_PK:
+            matches |= Q(pk=int(search_term))
+        return queryset.filter(matches), False
+
+    @admin.action(description='Deactivate selected jobs')
+    def deactivate_jobs(self, request, queryset):
+        updated = self.update_in_chunks(
+            queryset.filter(is_active=True), stats.record_jobs_deactivated,
+            is_active=False, updated_at=timezone.now(),
+        )
+        self.message_user(request, f'{updated} job(s) deactivated.', messages.SUCCESS)
+
 
 @admin.register(JobApplication)
-class JobApplicationAdmin(admin.ModelAdmin):
+class JobApplicationAdmin(PerformanceModelAdmin):
     list_display = ('job', 'freelancer', 'status', 'created_at')
     list_filter = ('status', 'created_at')
-    search_fields = ('job__title', 'freelancer__username')
\ No newline at end of file
+    list_select_related = ('job', 'freelancer')
+    autocomplete_fields = ('job', 'freelancer')
+    search_fields = ('^job__title', '^freelancer__username')
+    search_help_text = 'Search by the start of a job title or freelancer username.'
+    actions = ('reject_applications',)
+
+    def get_search_results(self, request, queryset, search_term):
+        # An OR across the two FK subqueries can't use either FK index, so
+        # match each side on its own (prefix index, then job_id / freelancer_id
+        # index) and filter on the UNION of the matching application IDs.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        jobs = Job.objects.filter(title__istartswith=search_term).values('pk')
+        freelancers = User.objects.filter(username__istartswith=search_term).values('pk')
+        matches = JobApplication.objects.filter(job__in=jobs).values('pk').union(
+            JobApplication.objects.filter(freelancer__in=freelancers).values('pk'),
+        )
+        return queryset.filter(pk__in=matches), False
+
+    @admin.action(description='Reject selected applications')
+    def reject_applications(self, request, queryset):
+        updated = self.update_in_chunks(
+            queryset.filter(status='pending'), stats.record_applications_rejected,
+            status='rejected', updated_at=timezone.now(),
+        )
+        self.message_user(request, f'{updated} application(s) rejected.', messages.SUCCESS)
@@ -0,0 +1,64 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter: load the WSGI app and serve a single request.
+FIRST_REQUEST_SCRIPT = """
+import json, os, sys
+from wsgiref.util import setup_testing_defaults
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'freelance_project.settings')
+from freelance_project.wsgi import application
+environ = {'PATH_INFO': sys.argv[1], 'HTTP_HOST': 'localhost', 'SERVER_NAME': 'localhost'}
+setup_testing_defaults(environ)
+statuses = []
+body = b''.join(application(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+print(json.dumps({'status': statuses[0], 'bytes': len(body)}))
+"""
+
+
+class Command(BaseCommand):
+    help = 'Measure wall time from process start to the first served request.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/jobs/',
+                            help='Request path served as the first request.')
+        parser.add_argument('--runs', type=int, default=5,
+                            help='Number of fresh processes to start.')
+        parser.add_argument('--warmup', action='store_true',
+                            help='Set WARMUP_ON_START=1 so the worker primes itself before serving.')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1.')
+
+        env = dict(os.environ)
+        env['WARMUP_ON_START'] = '1' if options['warmup'] else '0'
+
+        durations = []
+        for run in range(1, options['runs'] + 1):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, '-c', FIRST_REQUEST_SCRIPT, options['path']],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if result.returncode != 0:
+                raise CommandError(f'Run {run} failed:\n{result.stderr[-2000:]}')
+
+            response = json.loads(result.stdout.strip().splitlines()[-1])
+            durations.append(elapsed_ms)
+            self.stdout.write(
+                f"run {run}: {elapsed_ms:.1f} ms -> {response['status']} ({response['bytes']} bytes)"
+            )
+
+        self.stdout.write(
+            f'start to first response over {len(durations)} runs: '
+            f'min {min(durations):.1f} ms, median {statistics.median(durations):.1f} ms, '
+            f'max {max(durations):.1f} ms'
+        )
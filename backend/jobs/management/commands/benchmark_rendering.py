@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from freelance_project.middleware import brotli
+from freelance_project.renderers import FastJSONRenderer
+from jobs import views
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Report payload size and JSON encode time for the largest job endpoints.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Number of renders to average per renderer.')
+        parser.add_argument('--freelancer',
+                            help='Username used for my_applications (defaults to the first freelancer).')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError('--iterations must be at least 1.')
+
+        if options['freelancer']:
+            freelancer = User.objects.filter(username=options['freelancer'], user_type='freelancer').first()
+            if freelancer is None:
+                raise CommandError(f"No freelancer named '{options['freelancer']}'.")
+        else:
+            freelancer = User.objects.filter(user_type='freelancer').order_by('id').first()
+
+        factory = APIRequestFactory()
+        endpoints = [('job_list', views.job_list, None)]
+        if freelancer is not None:
+            endpoints.append(('my_applications', views.my_applications, freelancer))
+        else:
+            self.stdout.write(self.style.WARNING('No freelancer found; skipping my_applications.'))
+
+        renderers = [('stdlib', JSONRenderer()), ('fast', FastJSONRenderer())]
+
+        self.stdout.write(
+            f"{'endpoint':<18}{'renderer':<10}{'bytes':>10}{'gzip':>10}{'br':>10}{'encode ms':>12}"
+        )
+        for name, view, user in endpoints:
+            request = factory.get('/')
+            if user is not None:
+                force_authenticate(request, user=user)
+            data = view(request).data
+
+            for renderer_name, renderer in renderers:
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    content = renderer.render(data, 'application/json')
+                elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+
+                gzip_size = len(compress_string(content))
+                br_size = len(brotli.compress(content, quality=5)) if brotli is not None else '-'
+                self.stdout.write(
+                    f"{name:<18}{renderer_name:<10}{len(content):>10}{gzip_size:>10}{br_size:>10}{elapsed_ms:>12.3f}"
+                )
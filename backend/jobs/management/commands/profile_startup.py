@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Mirrors what a fresh worker does before serving its first request.
+STARTUP_SCRIPT = (
+    "import os; "
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'freelance_project.settings'); "
+    "from freelance_project.wsgi import application; "
+    "from django.urls import get_resolver; "
+    "get_resolver().url_patterns"
+)
+
+
+class Command(BaseCommand):
+    help = 'Report per-module import time for process start-up (python -X importtime).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=25,
+                            help='Number of modules/packages to list.')
+
+    def handle(self, *args, **options):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f'Start-up script failed:\n{result.stderr[-2000:]}')
+
+        modules = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            modules.append((name.strip(), int(self_us), int(cumulative_us)))
+
+        packages = defaultdict(int)
+        for name, self_us, _ in modules:
+            packages[name.split('.')[0]] += self_us
+        total_us = sum(packages.values())
+        limit = options['limit']
+
+        self.stdout.write(f'Total import time: {total_us / 1000:.1f} ms across {len(modules)} modules\n')
+        self.stdout.write(f"{'package':<40}{'self ms':>10}")
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:limit]:
+            self.stdout.write(f'{package:<40}{self_us / 1000:>10.1f}')
+
+        self.stdout.write(f"\n{'module':<40}{'self ms':>10}{'cumulative ms':>15}")
+        for name, self_us, cumulative_us in sorted(modules, key=lambda item: -item[2])[:limit]:
+            self.stdout.write(f'{name:<40}{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}')
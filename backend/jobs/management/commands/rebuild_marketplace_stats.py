@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs import stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-category marketplace stats rollup from scratch.'
+
+    def handle(self, *args, **options):
+        rows = stats.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt marketplace stats: {rows} category/day rows.'))
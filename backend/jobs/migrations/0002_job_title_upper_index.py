@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-19 15:52
+
+from django.db import migrations
+
+
+# Matches the SQL Django emits for `title__istartswith` on PostgreSQL,
+# UPPER("jobs_job"."title"::text) LIKE UPPER('term%'), so admin prefix
+# search can use an index. Other backends don't need (or support) it.
+# CONCURRENTLY keeps jobs_job writable while the index builds; it can't run
+# inside a transaction, hence atomic = False.
+INDEX_SQL = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_job_title_upper_like '
+    'ON jobs_job (UPPER(title::text) text_pattern_ops)'
+)
+DROP_SQL = 'DROP INDEX CONCURRENTLY IF EXISTS jobs_job_title_upper_like'
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(INDEX_SQL)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
\ No newline at end of file
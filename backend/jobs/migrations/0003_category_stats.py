@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-19 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_title_upper_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('web-development', 'Web Development'), ('mobile-development', 'Mobile Development'), ('design', 'Design'), ('writing', 'Writing'), ('marketing', 'Marketing'), ('other', 'Other')], max_length=50)),
+                ('date', models.DateField()),
+                ('jobs_posted', models.IntegerField(default=0)),
+                ('open_jobs', models.IntegerField(default=0)),
+                ('budget_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('budget_count', models.IntegerField(default=0)),
+                ('applications', models.IntegerField(default=0)),
+                ('pending_applications', models.IntegerField(default=0)),
+                ('accepted_applications', models.IntegerField(default=0)),
+                ('rejected_applications', models.IntegerField(default=0)),
+                ('bid_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('bid_count', models.IntegerField(default=0)),
+                ('first_application_seconds', models.BigIntegerField(default=0)),
+                ('first_application_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('category', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CategoryBidBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('web-development', 'Web Development'), ('mobile-development', 'Mobile Development'), ('design', 'Design'), ('writing', 'Writing'), ('marketing', 'Marketing'), ('other', 'Other')], max_length=50)),
+                ('date', models.DateField()),
+                ('bucket', models.IntegerField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('category', 'date', 'bucket')},
+            },
+        ),
+    ]
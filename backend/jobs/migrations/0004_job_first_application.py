@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 15:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_category_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFirstApplication',
+            fields=[
+                ('job', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', serialize=False, to='jobs.job')),
+                ('applied_at', models.DateTimeField()),
+            ],
+        ),
+    ]
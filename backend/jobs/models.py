@@ -55,4 +55,65 @@ class JobApplication(models.Model):
         unique_together = ('job', 'freelancer')
 
     def __str__(self):
-        return f"{self.freelancer.username} - {self.job.title}"
\ No newline at end of file
+        return f"{self.freelancer.username} - {self.job.title}"
+
+class CategoryDailyStats(models.Model):
+    """
+    Per-category, per-day rollup of marketplace activity.
+
+    Job metrics are keyed by the day the job was posted, application metrics
+    by the day the application was submitted. Rows are maintained
+    incrementally (see jobs/stats.py) and can be rebuilt from scratch with
+    `manage.py rebuild_marketplace_stats`.
+    """
+    category = models.CharField(max_length=50, choices=Job.CATEGORY_CHOICES)
+    date = models.DateField()
+    jobs_posted = models.IntegerField(default=0)
+    open_jobs = models.IntegerField(default=0)
+    budget_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    budget_count = models.IntegerField(default=0)
+    applications = models.IntegerField(default=0)
+    pending_applications = models.IntegerField(default=0)
+    accepted_applications = models.IntegerField(default=0)
+    rejected_applications = models.IntegerField(default=0)
+    bid_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    bid_count = models.IntegerField(default=0)
+    first_application_seconds = models.BigIntegerField(default=0)
+    first_application_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('category', 'date')
+
+    def __str__(self):
+        return f"{self.category} - {self.date}"
+
+class CategoryBidBucket(models.Model):
+    """
+    Histogram of bid amounts per category and day, on a log scale, used to
+    estimate median bids without reading individual applications.
+    """
+    category = models.CharField(max_length=50, choices=Job.CATEGORY_CHOICES)
+    date = models.DateField()
+    bucket = models.IntegerField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('category', 'date', 'bucket')
+
+    def __str__(self):
+        return f"{self.category} - {self.date} - {self.bucket}"
+
+class JobFirstApplication(models.Model):
+    """
+    The first-application time each job currently contributes to
+    CategoryDailyStats, so the contribution can be reversed exactly when the
+    earliest application is deleted or the job changes category. Not
+    constrained to Job: the row is removed by the job's post_delete handler.
+    """
+    job = models.OneToOneField(
+        Job, on_delete=models.DO_NOTHING, primary_key=True, db_constraint=False, related_name='+'
+    )
+    applied_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.job_id} - {self.applied_at}"
\ No newline at end of file
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import stats
+from .models import Job, JobApplication
+
+
+@receiver(pre_save, sender=Job)
+def remember_job(sender, instance, raw, **kwargs):
+    if not raw and instance.pk is not None:
+        instance._stats_previous = stats.stored_job_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+def update_job_stats(sender, instance, created, raw, **kwargs):
+    if not raw:
+        stats.job_saved(instance, created, getattr(instance, '_stats_previous', None))
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_stats(sender, instance, **kwargs):
+    stats.job_deleted(instance)
+
+
+@receiver(pre_save, sender=JobApplication)
+def remember_application(sender, instance, raw, **kwargs):
+    if not raw and instance.pk is not None:
+        instance._stats_previous = stats.stored_application_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=JobApplication)
+def update_application_stats(sender, instance, created, raw, **kwargs):
+    if not raw:
+        stats.application_saved(instance, created, getattr(instance, '_stats_previous', None))
+
+
+@receiver(post_delete, sender=JobApplication)
+def remove_application_stats(sender, instance, **kwargs):
+    stats.application_deleted(instance)
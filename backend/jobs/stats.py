@@ -0,0 +1,421 @@
+"""
+Incrementally maintained marketplace aggregates.
+
+Every change to a Job or JobApplication is turned into deltas against the
+CategoryDailyStats / CategoryBidBucket rollup rows, so reading stats costs
+O(categories x days) regardless of how many jobs and applications exist.
+
+A record's contribution is described by a small tuple (its "snapshot"):
+on update, the old snapshot is subtracted and the new one added. When a job
+changes category its applications' contributions move with it. Each job's
+time-to-first-application contribution is recorded in JobFirstApplication
+and re-synced (under a lock on the job row) whenever its applications
+change, so deleting the earliest application is reversed exactly.
+`manage.py rebuild_marketplace_stats` is only needed after raw SQL.
+"""
+import math
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import CategoryBidBucket, CategoryDailyStats, Job, JobApplication, JobFirstApplication
+
+# Bid histogram buckets are 5% wide and report their geometric midpoint,
+# which is within sqrt(1.05) (~2.5%) of every bid in the bucket; the median
+# of the bucketed bids is therefore within ~2.5% of the true median.
+BID_BUCKET_GROWTH = 1.05
+
+
+def bid_bucket(amount):
+    return math.floor(math.log(float(amount), BID_BUCKET_GROWTH))
+
+
+def bucket_midpoint(bucket):
+    return Decimal(BID_BUCKET_GROWTH ** (bucket + 0.5)).quantize(Decimal('0.01'))
+
+
+def _apply(category, date, deltas, sign=1):
+    deltas = {field: value * sign for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    with transaction.atomic():
+        CategoryDailyStats.objects.get_or_create(category=category, date=date)
+        CategoryDailyStats.objects.filter(category=category, date=date).update(
+            **{field: F(field) + value for field, value in deltas.items()}
+        )
+
+
+def _apply_bucket(category, date, bucket, delta):
+    if not delta:
+        return
+    with transaction.atomic():
+        CategoryBidBucket.objects.get_or_create(category=category, date=date, bucket=bucket)
+        CategoryBidBucket.objects.filter(category=category, date=date, bucket=bucket).update(
+            count=F('count') + delta
+        )
+
+
+def _apply_bid(category, date, amount, sign=1):
+    if amount is None or amount <= 0:
+        return
+    _apply_bucket(category, date, bid_bucket(amount), sign)
+
+
+def _application_totals(queryset, *fields):
+    """Application counters grouped by `fields` and submission day."""
+    return (
+        queryset.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values(*fields, 'day')
+        .annotate(
+            applications=Count('pk'),
+            pending_applications=Count('pk', filter=Q(status='pending')),
+            accepted_applications=Count('pk', filter=Q(status='accepted')),
+            rejected_applications=Count('pk', filter=Q(status='rejected')),
+            bid_total=Sum('bid_amount'),
+            bid_count=Count('bid_amount'),
+        )
+    )
+
+
+def _bid_bucket_counts(queryset, *fields):
+    """Bid histogram counts keyed by (*fields, day, bucket)."""
+    counts = defaultdict(int)
+    bids = (
+        queryset.filter(bid_amount__gt=0).order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values_list(*fields, 'day', 'bid_amount')
+    )
+    for *key, bid_amount in bids.iterator():
+        counts[(*key, bid_bucket(bid_amount))] += 1
+    return counts
+
+
+# First applications
+
+def _first_application_seconds(created_at, applied_at):
+    return max(int((applied_at - created_at).total_seconds()), 0)
+
+
+def _apply_first_application(category, created_at, applied_at, sign=1):
+    _apply(category, timezone.localdate(created_at), {
+        'first_application_seconds': _first_application_seconds(created_at, applied_at),
+        'first_application_count': 1,
+    }, sign)
+
+
+def _recorded_first_application(job_id):
+    return JobFirstApplication.objects.filter(job_id=job_id).values_list('applied_at', flat=True).first()
+
+
+def _sync_first_application(job_id):
+    """
+    Make the job's recorded first-application contribution match its
+    earliest remaining application. The job row is locked so concurrent
+    first applications can't both miss (or both record) the contribution.
+    """
+    with transaction.atomic():
+        job = Job.objects.select_for_update().filter(pk=job_id).values_list('category', 'created_at').first()
+        if job is None:
+            return
+        category, created_at = job
+        actual = JobApplication.objects.filter(job_id=job_id).aggregate(first=Min('created_at'))['first']
+        recorded = _recorded_first_application(job_id)
+        if actual == recorded:
+            return
+        if recorded is not None:
+            _apply_first_application(category, created_at, recorded, -1)
+        if actual is None:
+            JobFirstApplication.objects.filter(job_id=job_id).delete()
+        else:
+            _apply_first_application(category, created_at, actual, 1)
+            JobFirstApplication.objects.update_or_create(job_id=job_id, defaults={'applied_at': actual})
+
+
+# Jobs
+
+def job_snapshot(job):
+    return (job.category, job.created_at, job.is_active, job.budget)
+
+
+def stored_job_snapshot(pk):
+    row = Job.objects.filter(pk=pk).values_list('category', 'created_at', 'is_active', 'budget').first()
+    return tuple(row) if row else None
+
+
+def _apply_job(snapshot, sign):
+    category, created_at, is_active, budget = snapshot
+    deltas = {'jobs_posted': 1, 'open_jobs': int(is_active)}
+    if budget is not None:
+        deltas.update(budget_total=budget, budget_count=1)
+    _apply(category, timezone.localdate(created_at), deltas, sign)
+
+
+def _move_applications(job_id, created_at, old_category, new_category):
+    """Move a job's application, bid and first-application rows to a new category."""
+    applications = JobApplication.objects.filter(job_id=job_id)
+    for row in _application_totals(applications):
+        day = row.pop('day')
+        deltas = {field: value or 0 for field, value in row.items()}
+        _apply(old_category, day, deltas, -1)
+        _apply(new_category, day, deltas, 1)
+    for (day, bucket), count in _bid_bucket_counts(applications).items():
+        _apply_bucket(old_category, day, bucket, -count)
+        _apply_bucket(new_category, day, bucket, count)
+    recorded = _recorded_first_application(job_id)
+    if recorded is not None:
+        _apply_first_application(old_category, created_at, recorded, -1)
+        _apply_first_application(new_category, created_at, recorded, 1)
+
+
+def job_saved(job, created, previous=None):
+    current = job_snapshot(job)
+    if created:
+        _apply_job(current, 1)
+        return
+    if previous is None or previous == current:
+        return
+    with transaction.atomic():
+        _apply_job(previous, -1)
+        _apply_job(current, 1)
+        if previous[0] != current[0]:
+            _move_applications(job.pk, previous[1], previous[0], current[0])
+
+
+def job_deleted(job):
+    _apply_job(job_snapshot(job), -1)
+    # Cascaded application deletes normally clear this already.
+    recorded = _recorded_first_application(job.pk)
+    if recorded is not None:
+        _apply_first_application(job.category, job.created_at, recorded, -1)
+        JobFirstApplication.objects.filter(job_id=job.pk).delete()
+
+
+def record_jobs_deactivated(queryset):
+    """Account for a bulk `update(is_active=False)` about to run on queryset."""
+    rows = (
+        queryset.filter(is_active=True).order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('category', 'day')
+        .annotate(n=Count('pk'))
+    )
+    for row in rows:
+        _apply(row['category'], row['day'], {'open_jobs': row['n']}, sign=-1)
+
+
+# Applications
+
+def application_snapshot(application):
+    return (
+        application.job_id, application.job.category, application.created_at,
+        application.status, application.bid_amount,
+    )
+
+
+def stored_application_snapshot(pk):
+    row = (
+        JobApplication.objects.filter(pk=pk)
+        .values_list('job_id', 'job__category', 'created_at', 'status', 'bid_amount')
+        .first()
+    )
+    return tuple(row) if row else None
+
+
+def _apply_application(snapshot, sign):
+    _, category, created_at, status, bid_amount = snapshot
+    date = timezone.localdate(created_at)
+    deltas = {'applications': 1, f'{status}_applications': 1}
+    if bid_amount is not None:
+        deltas.update(bid_total=bid_amount, bid_count=1)
+    _apply(category, date, deltas, sign)
+    _apply_bid(category, date, bid_amount, sign)
+
+
+def application_saved(application, created, previous=None):
+    current = application_snapshot(application)
+    if created:
+        _apply_application(current, 1)
+        _sync_first_application(application.job_id)
+        return
+    if previous is None or previous == current:
+        return
+    with transaction.atomic():
+        _apply_application(previous, -1)
+        _apply_application(current, 1)
+        if previous[0] != current[0]:
+            _sync_first_application(previous[0])
+            _sync_first_application(current[0])
+
+
+def application_deleted(application):
+    _apply_application(application_snapshot(application), -1)
+    _sync_first_application(application.job_id)
+
+
+def record_applications_rejected(queryset):
+    """Account for a bulk `update(status='rejected')` about to run on queryset."""
+    rows = (
+        queryset.filter(status='pending').order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('job__category', 'day')
+        .annotate(n=Count('pk'))
+    )
+    for row in rows:
+        _apply(row['job__category'], row['day'], {
+            'pending_applications': -row['n'],
+            'rejected_applications': row['n'],
+        })
+
+
+# Full rebuild
+
+@transaction.atomic
+def rebuild():
+    """Recompute every rollup row from the Job and JobApplication tables."""
+    CategoryBidBucket.objects.all().delete()
+    CategoryDailyStats.objects.all().delete()
+    JobFirstApplication.objects.all().delete()
+
+    rows = defaultdict(lambda: defaultdict(int))
+
+    jobs = (
+        Job.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('category', 'day')
+        .annotate(
+            jobs_posted=Count('pk'),
+            open_jobs=Count('pk', filter=Q(is_active=True)),
+            budget_total=Sum('budget'),
+            budget_count=Count('budget'),
+        )
+    )
+    for row in jobs:
+        stats = rows[(row.pop('category'), row.pop('day'))]
+        for field, value in row.items():
+            stats[field] += value or 0
+
+    for row in _application_totals(JobApplication.objects.all(), 'job__category'):
+        stats = rows[(row.pop('job__category'), row.pop('day'))]
+        for field, value in row.items():
+            stats[field] += value or 0
+
+    first_applications = (
+        Job.objects.annotate(first_application_at=Min('applications__created_at'))
+        .filter(first_application_at__isnull=False)
+        .values_list('pk', 'category', 'created_at', 'first_application_at')
+    )
+    recorded = []
+    for pk, category, created_at, first_application_at in first_applications.iterator():
+        stats = rows[(category, timezone.localdate(created_at))]
+        stats['first_application_seconds'] += _first_application_seconds(created_at, first_application_at)
+        stats['first_application_count'] += 1
+        recorded.append(JobFirstApplication(job_id=pk, applied_at=first_application_at))
+
+    buckets = _bid_bucket_counts(JobApplication.objects.all(), 'job__category')
+
+    CategoryDailyStats.objects.bulk_create(
+        [CategoryDailyStats(category=category, date=date, **stats) for (category, date), stats in rows.items()],
+        batch_size=1000,
+    )
+    CategoryBidBucket.objects.bulk_create(
+        [
+            CategoryBidBucket(category=category, date=date, bucket=bucket, count=count)
+            for (category, date, bucket), count in buckets.items()
+        ],
+        batch_size=1000,
+    )
+    JobFirstApplication.objects.bulk_create(recorded, batch_size=1000)
+    return len(rows)
+
+
+# Reads
+
+def _average(total, count):
+    if not count:
+        return None
+    return str((Decimal(total) / count).quantize(Decimal('0.01')))
+
+
+def _median_bid(bucket_counts):
+    total = sum(count for _, count in bucket_counts)
+    if total <= 0:
+        return None
+    # Ranks (1-based) of the middle bid, or the two middle bids for an even
+    # total, whose bucket midpoints are averaged.
+    ranks = {(total + 1) // 2, total // 2 + 1}
+    midpoints = []
+    seen = 0
+    for bucket, count in sorted(bucket_counts):
+        seen += count
+        midpoints.extend(bucket_midpoint(bucket) for rank in sorted(ranks) if rank <= seen)
+        ranks = {rank for rank in ranks if rank > seen}
+        if not ranks:
+            break
+    return str((sum(midpoints) / len(midpoints)).quantize(Decimal('0.01')))
+
+
+def category_summary(start=None, end=None, category=None):
+    """
+    Per-category marketplace stats for jobs/applications dated within
+    [start, end] (inclusive, either bound optional).
+    """
+    filters = Q()
+    if start is not None:
+        filters &= Q(date__gte=start)
+    if end is not None:
+        filters &= Q(date__lte=end)
+    if category is not None:
+        filters &= Q(category=category)
+
+    daily = CategoryDailyStats.objects.filter(filters)
+    totals = daily.order_by('category').values('category').annotate(
+        jobs_posted_sum=Sum('jobs_posted'),
+        open_jobs_sum=Sum('open_jobs'),
+        budget_total_sum=Sum('budget_total'),
+        budget_count_sum=Sum('budget_count'),
+        applications_sum=Sum('applications'),
+        pending_sum=Sum('pending_applications'),
+        accepted_sum=Sum('accepted_applications'),
+        rejected_sum=Sum('rejected_applications'),
+        bid_total_sum=Sum('bid_total'),
+        bid_count_sum=Sum('bid_count'),
+        first_seconds_sum=Sum('first_application_seconds'),
+        first_count_sum=Sum('first_application_count'),
+    )
+
+    per_day = defaultdict(list)
+    for row in daily.filter(applications__gt=0).order_by('category', 'date').values('category', 'date', 'applications'):
+        per_day[row['category']].append({'date': row['date'].isoformat(), 'count': row['applications']})
+
+    bucket_counts = defaultdict(list)
+    buckets = (
+        CategoryBidBucket.objects.filter(filters).order_by()
+        .values('category', 'bucket').annotate(n=Sum('count'))
+    )
+    for row in buckets:
+        bucket_counts[row['category']].append((row['bucket'], row['n']))
+
+    summary = []
+    for row in totals:
+        first_count = row['first_count_sum']
+        summary.append({
+            'category': row['category'],
+            'jobs_posted': row['jobs_posted_sum'],
+            'open_jobs': row['open_jobs_sum'],
+            'average_budget': _average(row['budget_total_sum'], row['budget_count_sum']),
+            'applications': row['applications_sum'],
+            'pending_applications': row['pending_sum'],
+            'accepted_applications': row['accepted_sum'],
+            'rejected_applications': row['rejected_sum'],
+            'average_bid': _average(row['bid_total_sum'], row['bid_count_sum']),
+            'median_bid': _median_bid(bucket_counts[row['category']]),
+            'average_seconds_to_first_application': (
+                row['first_seconds_sum'] // first_count if first_count else None
+            ),
+            'applications_per_day': per_day[row['category']],
+        })
+    return summary
@@ -1,3 +1,232 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.admin.sites import site
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, TestCase
+
+from users.models import User
+from . import stats
+from .admin import JobAdmin, JobApplicationAdmin
+from .models import CategoryBidBucket, CategoryDailyStats, Job, JobApplication, JobFirstApplication
+
+START = datetime.datetime(2025, 7, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def at(days=0, hours=0):
+    """Pin timezone.now() (and so auto_now_add) to START plus an offset."""
+    return mock.patch('django.utils.timezone.now', return_value=START + datetime.timedelta(days=days, hours=hours))
+
+
+class AdminSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = User.objects.create_user('client', password='pw', user_type='client')
+        cls.freelancer = User.objects.create_user('Freelancer', password='pw', user_type='freelancer')
+        cls.job = Job.objects.create(
+            client=cls.client_user, title='Build site', description='A description here', category='design',
+        )
+        cls.other_job = Job.objects.create(
+            client=cls.client_user, title='Logo', description='A description here', category='design',
+        )
+        cls.application = JobApplication.objects.create(
+            job=cls.job, freelancer=cls.freelancer, cover_letter='Cover letter text',
+        )
+
+    def search(self, admin_class, model, term):
+        request = RequestFactory().get('/')
+        queryset, may_have_duplicates = admin_class(model, site).get_search_results(
+            request, model.objects.all(), term,
+        )
+        self.assertFalse(may_have_duplicates)
+        return list(queryset)
+
+    def test_job_title_prefix_is_case_insensitive(self):
+        self.assertEqual(self.search(JobAdmin, Job, 'build'), [self.job])
+
+    def test_job_search_by_id(self):
+        self.assertEqual(self.search(JobAdmin, Job, str(self.other_job.pk)), [self.other_job])
+
+    def test_job_search_tolerates_odd_numbers(self):
+        for term in ('²', '99999999999999999999'):
+            with self.subTest(term=term):
+                self.assertEqual(self.search(JobAdmin, Job, term), [])
+
+    def test_application_search_by_title_or_username(self):
+        self.assertEqual(self.search(JobApplicationAdmin, JobApplication, 'BUILD'), [self.application])
+        self.assertEqual(self.search(JobApplicationAdmin, JobApplication, 'free'), [self.application])
+        self.assertEqual(self.search(JobApplicationAdmin, JobApplication, 'logo'), [])
+
+    def test_user_autocomplete_is_prefix_only(self):
+        # JobAdmin/JobApplicationAdmin autocompletes search through the User admin.
+        user_admin = type(site._registry[User])
+        self.assertEqual(self.search(user_admin, User, 'FREE'), [self.freelancer])
+        self.assertEqual(self.search(user_admin, User, 'lancer'), [])
+
+
+class MarketplaceStatsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_user = User.objects.create_user('client', password='pw', user_type='client')
+        cls.freelancers = [
+            User.objects.create_user(f'freelancer{i}', password='pw', user_type='freelancer') for i in range(3)
+        ]
+        cls.jobs = []
+        for day, (category, budget) in enumerate([
+            ('design', Decimal('100.00')), ('writing', None), ('design', Decimal('250.00')),
+        ]):
+            with at(days=day):
+                cls.jobs.append(Job.objects.create(
+                    client=cls.client_user, title=f'Job {day}', description='A description here',
+                    category=category, budget=budget,
+                ))
+        for job_index, job in enumerate(cls.jobs):
+            for i, freelancer in enumerate(cls.freelancers):
+                with at(days=job_index, hours=i + 1):
+                    JobApplication.objects.create(
+                        job=job, freelancer=freelancer, cover_letter='Cover letter text',
+                        bid_amount=Decimal(40 + 35 * i) if i != 1 else None,
+                    )
+
+    def rollup(self):
+        daily = {
+            (row.category, row.date): tuple(getattr(row, field.name) for field in row._meta.fields[3:])
+            for row in CategoryDailyStats.objects.all()
+        }
+        return (
+            {key: values for key, values in daily.items() if any(values)},
+            {(row.category, row.date, row.bucket): row.count for row in CategoryBidBucket.objects.all() if row.count},
+            set(JobFirstApplication.objects.values_list('job_id', 'applied_at')),
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = self.rollup()
+        stats.rebuild()
+        self.assertEqual(incremental, self.rollup())
+
+
+class IncrementalStatsTests(MarketplaceStatsTestCase):
+    def admin_request(self):
+        request = RequestFactory().post('/')
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_create(self):
+        self.assertMatchesRebuild()
+        design = stats.category_summary(category='design')[0]
+        self.assertEqual(design['jobs_posted'], 2)
+        self.assertEqual(design['applications'], 6)
+        self.assertEqual(design['average_seconds_to_first_application'], 3600)
+
+    def test_status_change(self):
+        application = JobApplication.objects.filter(job=self.jobs[0]).first()
+        application.status = 'accepted'
+        application.save()
+        application.status = 'rejected'
+        application.save()
+        job = self.jobs[1]
+        job.is_active = False
+        job.budget = Decimal('80.00')
+        job.save()
+        self.assertMatchesRebuild()
+
+    def test_bulk_admin_actions(self):
+        JobApplicationAdmin(JobApplication, site).reject_applications(
+            self.admin_request(), JobApplication.objects.filter(job__category='design'),
+        )
+        JobAdmin(Job, site).deactivate_jobs(self.admin_request(), Job.objects.all())
+        self.assertEqual(JobApplication.objects.filter(status='rejected').count(), 6)
+        self.assertMatchesRebuild()
+
+    def test_job_delete(self):
+        self.jobs[0].delete()
+        self.assertMatchesRebuild()
+
+    def test_freelancer_delete_removes_first_applications(self):
+        self.freelancers[0].delete()
+        self.assertMatchesRebuild()
+        self.assertEqual(stats.category_summary(category='design')[0]['average_seconds_to_first_application'], 7200)
+
+    def test_client_delete(self):
+        self.client_user.delete()
+        self.assertMatchesRebuild()
+        self.assertEqual(stats.category_summary(), [])
+
+    def test_category_change_moves_applications(self):
+        job = Job.objects.get(pk=self.jobs[0].pk)
+        job.category = 'marketing'
+        job.save()
+        self.assertMatchesRebuild()
+        marketing = stats.category_summary(category='marketing')[0]
+        self.assertEqual(marketing['applications'], 3)
+        self.assertEqual(marketing['average_seconds_to_first_application'], 3600)
+
+    def test_application_moved_to_another_job(self):
+        application = JobApplication.objects.get(job=self.jobs[0], freelancer=self.freelancers[0])
+        application.job = Job.objects.create(
+            client=self.client_user, title='New job', description='A description here', category='other',
+        )
+        application.save()
+        self.assertMatchesRebuild()
+
+
+class MarketplaceStatsViewTests(MarketplaceStatsTestCase):
+    def setUp(self):
+        self.client.force_login(self.client_user)
+
+    def test_requires_login(self):
+        self.client.logout()
+        self.assertEqual(self.client.get('/api/jobs/stats/').status_code, 403)
+
+    def test_invalid_parameters(self):
+        for query in ('start=2025-13-01', 'end=yesterday', 'start=2025-07-03&end=2025-07-01', 'category=nope'):
+            with self.subTest(query=query):
+                response = self.client.get(f'/api/jobs/stats/?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.json())
+
+    def test_all_time(self):
+        response = self.client.get('/api/jobs/stats/')
+        self.assertEqual(response.status_code, 200)
+        design, writing = response.json()
+        self.assertEqual(design['category'], 'design')
+        self.assertEqual(design['jobs_posted'], 2)
+        self.assertEqual(design['open_jobs'], 2)
+        self.assertEqual(design['average_budget'], '175.00')
+        self.assertEqual(design['average_bid'], '75.00')
+        # Bids 40, 40, 110, 110: mean of the 40 and 110 bucket midpoints.
+        self.assertEqual(design['median_bid'], '75.32')
+        self.assertEqual(design['applications_per_day'], [
+            {'date': '2025-07-01', 'count': 3}, {'date': '2025-07-03', 'count': 3},
+        ])
+        self.assertEqual(writing['average_budget'], None)
+
+    def test_median_bid_odd_count(self):
+        application = JobApplication.objects.get(job=self.jobs[2], freelancer=self.freelancers[2])
+        application.bid_amount = None
+        application.save()
+        # Bids 40, 40, 110: the 40 bucket's midpoint.
+        design = self.client.get('/api/jobs/stats/?category=design').json()[0]
+        self.assertEqual(design['median_bid'], '39.79')
+
+    def test_median_bid_even_count_spans_buckets(self):
+        application = JobApplication.objects.get(job=self.jobs[1], freelancer=self.freelancers[2])
+        application.bid_amount = Decimal('90.00')
+        application.save()
+        # Bids 40, 90 (true median 65): mean of the 39.79 and 91.20 midpoints.
+        writing = self.client.get('/api/jobs/stats/?category=writing').json()[0]
+        self.assertEqual(writing['median_bid'], '65.50')
+
+    def test_date_range_filters_rows(self):
+        response = self.client.get('/api/jobs/stats/?start=2025-07-02&end=2025-07-03')
+        self.assertEqual([row['category'] for row in response.json()], ['design', 'writing'])
+        design = response.json()[0]
+        self.assertEqual(design['jobs_posted'], 1)
+        self.assertEqual(design['average_budget'], '250.00')
+        self.assertEqual(design['applications_per_day'], [{'date': '2025-07-03', 'count': 3}])
+
+    def test_category_filter(self):
+        response = self.client.get('/api/jobs/stats/?category=writing&end=2025-07-01')
+        self.assertEqual(response.json(), [])
@@ -7,6 +7,7 @@ urlpatterns = [
     path('create/', views.create_job, name='create_job'),
     path('my-jobs/', views.my_jobs, name='my_jobs'),
     path('my-applications/', views.my_applications, name='my_applications'),
+    path('stats/', views.marketplace_stats, name='marketplace_stats'),
     path('<int:job_id>/apply/', views.apply_to_job, name='apply_to_job'),
     path('<int:job_id>/applications/', views.job_applications, name='job_applications'),
     path('applications/<int:application_id>/status/', views.update_application_status, name='update_application_status'),
@@ -3,6 +3,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from . import stats
 from .models import Job, JobApplication
 from .serializers import JobSerializer, JobApplicationSerializer, CreateJobApplicationSerializer
 from users.models import User
@@ -114,4 +116,26 @@ def update_application_status(request, application_id):
     application.save()
     
     serializer = JobApplicationSerializer(application)
-    return Response(serializer.data)
\ No newline at end of file
+    return Response(serializer.data)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def marketplace_stats(request):
+    # Served from the precomputed rollup, so cost doesn't grow with job volume
+    dates = {}
+    for name in ('start', 'end'):
+        value = request.GET.get(name)
+        try:
+            dates[name] = parse_date(value) if value else None
+        except ValueError:
+            dates[name] = None
+        if value and dates[name] is None:
+            return Response({'error': f'{name} must be a date in YYYY-MM-DD format'}, status=status.HTTP_400_BAD_REQUEST)
+    if dates['start'] and dates['end'] and dates['start'] > dates['end']:
+        return Response({'error': 'start must be on or before end'}, status=status.HTTP_400_BAD_REQUEST)
+
+    category = request.GET.get('category', None)
+    if category and category not in dict(Job.CATEGORY_CHOICES):
+        return Response({'error': 'Invalid category'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(stats.category_summary(start=dates['start'], end=dates['end'], category=category or None))
\ No newline at end of file
@@ -5,6 +5,11 @@ from .models import User
 class CustomUserAdmin(UserAdmin):
     list_display = ('username', 'email', 'user_type', 'is_staff')
     list_filter = ('user_type', 'is_staff', 'is_superuser', 'is_active')
+    # Also backs the job client / application freelancer autocompletes; a
+    # prefix match uses the UPPER(username) index instead of '%term%' scans
+    # over username, names and email.
+    search_fields = ('^username',)
+    search_help_text = 'Search by the start of the username.'
     fieldsets = UserAdmin.fieldsets + (
         ('User Type', {'fields': ('user_type', 'bio', 'profile_picture')}),
     )